@@ -4,6 +4,17 @@ class APIResponseError(Exception):
     pass
 
 
+class APIRetryableError(APIResponseError):
+    """Исключение для временных ошибок API, после которых запрос повторяется.
+
+    Если сервер сам указал паузу до повтора, она хранится в `retry_after`.
+    """
+
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 class WorkKeyError(Exception):
     """Исключение для ошибок связанных с ключом работы."""
 
@@ -16,6 +27,12 @@ class WorkStatusError(Exception):
     pass
 
 
+class HomeworkParseError(Exception):
+    """Исключение для домашних работ, которые не удалось разобрать."""
+
+    pass
+
+
 class TelegramError(Exception):
     """Исключение для ошибок при отправке сообщения в Telegram."""
 
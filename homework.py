@@ -1,16 +1,20 @@
 import logging
 import os
+import random
 import sys
 import time
+from functools import lru_cache
+from email.utils import parsedate_to_datetime
 from http import HTTPStatus
 from json.decoder import JSONDecodeError
-from typing import Dict, List, Union, Any, Optional
+from typing import Dict, List, Tuple, Union, Any, Optional
 
 import requests
 from dotenv import load_dotenv
 from telebot import TeleBot
 
-from exceptions import (APIResponseError, TelegramError, WorkKeyError,
+from exceptions import (APIResponseError, APIRetryableError,
+                        HomeworkParseError, TelegramError, WorkKeyError,
                         WorkStatusError)
 
 load_dotenv()
@@ -18,19 +22,45 @@ load_dotenv()
 PRACTICUM_TOKEN = os.getenv('PRACTICUM_TOKEN')
 TELEGRAM_TOKEN = os.getenv('TELEGRAM_TOKEN')
 TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID')
+LOG_LEVEL = (os.getenv('LOG_LEVEL') or 'INFO').upper()
+LOG_LEVELS = {
+    logging.getLevelName(level): level
+    for level in (logging.CRITICAL, logging.ERROR, logging.WARNING,
+                  logging.INFO, logging.DEBUG)
+}
+LOG_LEVEL_VALUE = (
+    int(LOG_LEVEL) if LOG_LEVEL.isdigit()
+    else LOG_LEVELS.get(LOG_LEVEL, logging.INFO)
+)
 
 
 logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    level=logging.DEBUG,
+    level=LOG_LEVEL_VALUE,
     handlers=[logging.StreamHandler(sys.stdout)]
 )
 
 logger = logging.getLogger(__name__)
 
+if not LOG_LEVEL.isdigit() and LOG_LEVEL not in LOG_LEVELS:
+    logger.warning(
+        'Неизвестный уровень логирования LOG_LEVEL=%s, используется INFO',
+        LOG_LEVEL
+    )
+
 RETRY_PERIOD = 600
+RETRY_BACKOFF_BASE = 30
+RETRY_MAX_ATTEMPT = 5
+RETRYABLE_STATUSES = (
+    HTTPStatus.INTERNAL_SERVER_ERROR,
+    HTTPStatus.BAD_GATEWAY,
+    HTTPStatus.SERVICE_UNAVAILABLE,
+    HTTPStatus.GATEWAY_TIMEOUT,
+)
 ENDPOINT = 'https://practicum.yandex.ru/api/user_api/homework_statuses/'
 HEADERS = {'Authorization': f'OAuth {PRACTICUM_TOKEN}'}
+PARAMS = {'from_date': 0}
+REQUEST_TIMEOUT = (5, 30)
 
 
 HOMEWORK_VERDICTS = {
@@ -39,23 +69,25 @@ HOMEWORK_VERDICTS = {
     'rejected': 'Работа проверена: у ревьюера есть замечания.'
 }
 
+HOMEWORK_TEMPLATES = {
+    status: 'Изменился статус проверки работы "{}". ' + verdict
+    for status, verdict in HOMEWORK_VERDICTS.items()
+}
+
 
 def check_tokens() -> List[str]:
     """Проверка доступности переменных окружения."""
-    tokens = {
-        'PRACTICUM_TOKEN': PRACTICUM_TOKEN,
-        'TELEGRAM_TOKEN': TELEGRAM_TOKEN,
-        'TELEGRAM_CHAT_ID': TELEGRAM_CHAT_ID
-    }
-
-    missing_tokens = [
+    tokens = (
+        ('PRACTICUM_TOKEN', PRACTICUM_TOKEN),
+        ('TELEGRAM_TOKEN', TELEGRAM_TOKEN),
+        ('TELEGRAM_CHAT_ID', TELEGRAM_CHAT_ID),
+    )
+    return [
         token_name
-        for token_name, token_value in tokens.items()
+        for token_name, token_value in tokens
         if not token_value
     ]
 
-    return missing_tokens
-
 
 def send_message(bot: TeleBot, message: str) -> None:
     """Отправляет сообщение в Telegram чат."""
@@ -64,26 +96,46 @@ def send_message(bot: TeleBot, message: str) -> None:
             chat_id=TELEGRAM_CHAT_ID,
             text=message,
         )
-        logger.debug(f'Бот отправил сообщение: {message}')
+        logger.debug('Бот отправил сообщение: %s', message)
 
     except Exception as error:
         raise TelegramError(f'Сбой при отправке сообщения в Telegram: {error}')
 
 
+def get_retry_after(response: requests.Response) -> float:
+    """Возвращает паузу из заголовка Retry-After, не больше RETRY_PERIOD."""
+    retry_after = response.headers.get('Retry-After', '').strip()
+    if retry_after.isdigit():
+        return min(RETRY_PERIOD, int(retry_after))
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return RETRY_PERIOD
+    return min(RETRY_PERIOD, max(0, retry_at.timestamp() - time.time()))
+
+
 def get_api_answer(timestamp: int) -> Optional[Dict[str, Union[int, list]]]:
     """Делает запрос к API-сервиса."""
+    PARAMS['from_date'] = timestamp
     try:
         response = requests.get(
             ENDPOINT,
             headers=HEADERS,
-            params={'from_date': timestamp}
+            params=PARAMS,
+            timeout=REQUEST_TIMEOUT
         )
-        if response.status_code != HTTPStatus.OK.value:
-            raise APIResponseError(
-                f'Сбой в работе программы.\n'
+        if response.status_code != HTTPStatus.OK:
+            message = (
                 f'Эндпоинт {ENDPOINT} недоступен.\n'
                 f'Код ответа: {response.status_code}'
             )
+            if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+                raise APIRetryableError(
+                    message, retry_after=get_retry_after(response)
+                )
+            if response.status_code in RETRYABLE_STATUSES:
+                raise APIRetryableError(message)
+            raise APIResponseError(message)
 
         try:
             return response.json()
@@ -108,6 +160,12 @@ def check_response(response: Any) -> list:
     return homeworks
 
 
+@lru_cache(maxsize=128)
+def format_status(homework_name: str, homework_status: str) -> str:
+    """Формирует сообщение об изменении статуса домашней работы."""
+    return HOMEWORK_TEMPLATES[homework_status].format(homework_name)
+
+
 def parse_status(homework: dict) -> str:
     """Извлечение статуса домашней работы."""
     try:
@@ -116,11 +174,39 @@ def parse_status(homework: dict) -> str:
     except KeyError as key:
         raise WorkKeyError(f'В ответе API отсутствует ключ: {key}')
 
-    if homework_status not in HOMEWORK_VERDICTS:
+    try:
+        hash(homework_name)
+    except TypeError:
+        raise TypeError(
+            f'Некорректное значение поля "homework_name": {homework_name!r}'
+        )
+
+    if homework_status not in HOMEWORK_TEMPLATES:
         raise WorkStatusError(f'Неизвестный статус работы: {homework_status}')
 
-    verdict = HOMEWORK_VERDICTS[homework_status]
-    return f'Изменился статус проверки работы "{homework_name}". {verdict}'
+    return format_status(homework_name, homework_status)
+
+
+def parse_homeworks(homeworks: list) -> Tuple[List[str], List[Exception]]:
+    """Разбирает все домашние работы, собирая сообщения и ошибки отдельно."""
+    messages = []
+    errors = []
+    for homework in homeworks:
+        try:
+            messages.append(parse_status(homework))
+        except Exception as error:
+            errors.append(error)
+    return messages, errors
+
+
+def get_retry_delay(error: APIRetryableError, attempt: int) -> float:
+    """Вычисляет паузу перед повтором запроса после временной ошибки API."""
+    if error.retry_after is not None:
+        return error.retry_after
+    backoff = min(
+        RETRY_PERIOD - RETRY_BACKOFF_BASE, RETRY_BACKOFF_BASE * 2 ** attempt
+    )
+    return backoff + random.uniform(0, RETRY_BACKOFF_BASE)
 
 
 def main() -> None:
@@ -128,42 +214,55 @@ def main() -> None:
     missing_tokens = check_tokens()
     if missing_tokens:
         logging.critical(
-            'Отсутствуют обязательные переменные окружения: '
-            f'{", ".join(missing_tokens)}\n'
-            'Программа принудительно остановлена.')
+            'Отсутствуют обязательные переменные окружения: %s\n'
+            'Программа принудительно остановлена.',
+            ', '.join(missing_tokens)
+        )
         sys.exit(1)
 
     bot = TeleBot(token=TELEGRAM_TOKEN)
     timestamp = int(time.time())
-    last_error = None
+    last_error_message = None
     last_message = None
+    retry_attempt = 0
 
     while True:
+        retry_delay = RETRY_PERIOD
         try:
             response = get_api_answer(timestamp)
             homeworks = check_response(response)
+            messages, parse_errors = parse_homeworks(homeworks)
 
-            if homeworks:
-                message = parse_status(homeworks[0])
-                if message != last_message:
-                    send_message(bot, message)
-                    last_message = message
-
-            else:
+            message = '\n\n'.join(messages)
+            if message and message != last_message:
+                send_message(bot, message)
+                last_message = message
+            elif not homeworks:
                 logger.debug('Нет новых статусов')
 
             timestamp = response.get('current_date', timestamp)
+            retry_attempt = 0
+            last_error_message = None
+
+            if parse_errors:
+                raise HomeworkParseError(
+                    '\n'.join(str(error) for error in parse_errors)
+                )
 
         except Exception as error:
             error_message = f'Сбой в работе программы: {error}'
             logger.error(error_message)
 
-            if str(error) != str(last_error):
-                send_message(bot, error)
-                last_error = error
+            if isinstance(error, APIRetryableError):
+                retry_delay = get_retry_delay(error, retry_attempt)
+                retry_attempt = min(retry_attempt + 1, RETRY_MAX_ATTEMPT)
+
+            if error_message != last_error_message:
+                send_message(bot, error_message)
+                last_error_message = error_message
 
         finally:
-            time.sleep(RETRY_PERIOD)
+            time.sleep(retry_delay)
 
 
 if __name__ == '__main__':
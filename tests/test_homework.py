@@ -0,0 +1,254 @@
+import importlib
+import logging
+import time
+from http import HTTPStatus
+
+import pytest
+import requests
+
+import tests.check_utils as check_utils
+
+
+class StopMain(Exception):
+    pass
+
+
+class MockResponseWithHeaders(check_utils.MockResponseGET):
+    def __init__(self, *args, headers=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.headers = headers or {}
+
+
+class RecordingBot:
+    def __init__(self, *args, **kwargs):
+        self.sent = []
+
+    def send_message(self, chat_id=None, text=None, **kwargs):
+        self.sent.append(text)
+
+
+def run_main(monkeypatch, homework_module, responses):
+    """Run `main()` for one iteration per response and record its effects."""
+    iterations = len(responses)
+    responses = iter(responses)
+    bot = RecordingBot()
+    from_dates = []
+    delays = []
+
+    def mock_get(*args, **kwargs):
+        from_dates.append(kwargs['params']['from_date'])
+        http_status, data, *headers = next(responses)
+        return MockResponseWithHeaders(
+            http_status=http_status, data=data,
+            headers=headers[0] if headers else None
+        )
+
+    def mock_sleep(secs):
+        delays.append(secs)
+        if len(delays) == iterations:
+            raise StopMain
+
+    monkeypatch.setattr(homework_module, 'TELEGRAM_TOKEN', '1234:abcdefg')
+    monkeypatch.setattr(homework_module, 'TeleBot', lambda token: bot)
+    monkeypatch.setattr(requests, 'get', mock_get)
+    monkeypatch.setattr(time, 'sleep', mock_sleep)
+    with pytest.raises(StopMain):
+        homework_module.main()
+    return bot.sent, from_dates, delays
+
+
+def test_main_joins_all_homeworks(monkeypatch, homework_module):
+    data = {
+        'homeworks': [
+            {'homework_name': 'hw1', 'status': 'approved'},
+            {'homework_name': 'hw2', 'status': 'rejected'},
+        ],
+        'current_date': 1000198000,
+    }
+    sent, _, _ = run_main(
+        monkeypatch, homework_module, [(HTTPStatus.OK, data)]
+    )
+    assert sent == [
+        homework_module.parse_status(data['homeworks'][0])
+        + '\n\n'
+        + homework_module.parse_status(data['homeworks'][1])
+    ]
+
+
+def test_main_sends_valid_homeworks_despite_invalid_ones(
+        monkeypatch, homework_module
+):
+    valid = {'homework_name': 'hw1', 'status': 'approved'}
+    data = {
+        'homeworks': [valid, {'homework_name': 'hw2', 'status': 'weird'}],
+        'current_date': 1000198000,
+    }
+    empty = {'homeworks': [], 'current_date': 1000198001}
+    sent, from_dates, _ = run_main(
+        monkeypatch, homework_module,
+        [(HTTPStatus.OK, data), (HTTPStatus.OK, empty)]
+    )
+    assert sent == [
+        homework_module.parse_status(valid),
+        'Сбой в работе программы: Неизвестный статус работы: weird',
+    ]
+    assert from_dates[1] == data['current_date']
+
+
+@pytest.mark.parametrize('http_status', [
+    HTTPStatus.INTERNAL_SERVER_ERROR,
+    HTTPStatus.BAD_GATEWAY,
+    HTTPStatus.SERVICE_UNAVAILABLE,
+    HTTPStatus.GATEWAY_TIMEOUT,
+])
+def test_transient_statuses_are_retryable(
+        monkeypatch, homework_module, http_status
+):
+    monkeypatch.setattr(
+        requests, 'get',
+        lambda *args, **kwargs: check_utils.MockResponseGET(
+            http_status=http_status
+        )
+    )
+    with pytest.raises(homework_module.APIRetryableError) as error:
+        homework_module.get_api_answer(0)
+    assert error.value.retry_after is None
+
+
+@pytest.mark.parametrize('headers, retry_after', [
+    ({'Retry-After': '120'}, 120),
+    ({'Retry-After': '5000'}, 600),
+    ({'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'}, 0),
+    ({'Retry-After': 'soon'}, 600),
+    ({}, 600),
+])
+def test_too_many_requests_respects_retry_after(
+        monkeypatch, homework_module, headers, retry_after
+):
+    monkeypatch.setattr(
+        requests, 'get',
+        lambda *args, **kwargs: MockResponseWithHeaders(
+            http_status=HTTPStatus.TOO_MANY_REQUESTS, headers=headers
+        )
+    )
+    with pytest.raises(homework_module.APIRetryableError) as error:
+        homework_module.get_api_answer(0)
+    assert error.value.retry_after == retry_after
+
+
+@pytest.mark.parametrize('http_status', [
+    HTTPStatus.BAD_REQUEST,
+    HTTPStatus.UNAUTHORIZED,
+    HTTPStatus.NO_CONTENT,
+])
+def test_other_statuses_are_not_retryable(
+        monkeypatch, homework_module, http_status
+):
+    monkeypatch.setattr(
+        requests, 'get',
+        lambda *args, **kwargs: check_utils.MockResponseGET(
+            http_status=http_status
+        )
+    )
+    with pytest.raises(homework_module.APIResponseError) as error:
+        homework_module.get_api_answer(0)
+    assert not isinstance(error.value, homework_module.APIRetryableError)
+
+
+@pytest.mark.parametrize('jitter', ['min', 'max'])
+def test_retry_delay_bounds(monkeypatch, homework_module, jitter):
+    monkeypatch.setattr(
+        homework_module.random, 'uniform',
+        lambda low, high: low if jitter == 'min' else high
+    )
+    error = homework_module.APIRetryableError('')
+    for attempt in range(100):
+        delay = homework_module.get_retry_delay(error, attempt)
+        assert homework_module.RETRY_BACKOFF_BASE <= delay
+        assert delay <= homework_module.RETRY_PERIOD
+
+
+def test_main_backoff_grows_and_resets(monkeypatch, homework_module):
+    monkeypatch.setattr(homework_module.random, 'uniform', lambda low, _: low)
+    unavailable = (HTTPStatus.SERVICE_UNAVAILABLE, {})
+    ok = (HTTPStatus.OK, {'homeworks': [], 'current_date': 1000198000})
+    _, _, delays = run_main(
+        monkeypatch, homework_module, [unavailable] * 7 + [ok, unavailable]
+    )
+    assert delays == [30, 60, 120, 240, 480, 570, 570, 600, 30]
+
+
+def test_retry_delay_keeps_jitter_at_cap(monkeypatch, homework_module):
+    attempt = homework_module.RETRY_MAX_ATTEMPT
+    monkeypatch.setattr(homework_module.random, 'uniform', lambda low, _: low)
+    error = homework_module.APIRetryableError('')
+    lowest = homework_module.get_retry_delay(error, attempt)
+    monkeypatch.setattr(homework_module.random, 'uniform', lambda _, high: high)
+    highest = homework_module.get_retry_delay(error, attempt)
+    assert highest - lowest == homework_module.RETRY_BACKOFF_BASE
+    assert highest == homework_module.RETRY_PERIOD
+
+
+def test_parse_status_rejects_unhashable_name(homework_module):
+    with pytest.raises(TypeError, match='homework_name'):
+        homework_module.parse_status(
+            {'homework_name': ['hw123'], 'status': 'approved'}
+        )
+
+
+def test_parse_status_formats_non_string_name(homework_module):
+    assert homework_module.parse_status(
+        {'homework_name': 123, 'status': 'approved'}
+    ).startswith('Изменился статус проверки работы "123"')
+
+
+@pytest.mark.parametrize('headers, expected_delay', [
+    ({'Retry-After': '120'}, 120),
+    ({}, 600),
+])
+def test_main_waits_as_asked_after_too_many_requests(
+        monkeypatch, homework_module, headers, expected_delay
+):
+    too_many = (HTTPStatus.TOO_MANY_REQUESTS, {}, headers)
+    _, _, delays = run_main(monkeypatch, homework_module, [too_many] * 2)
+    assert delays == [expected_delay] * 2
+
+
+@pytest.fixture
+def reload_homework(monkeypatch, homework_module):
+    """Re-import `homework` with a clean root logger, then restore it."""
+    def reload_with_log_level(log_level):
+        monkeypatch.setenv('LOG_LEVEL', log_level)
+        monkeypatch.setattr(logging.root, 'handlers', [])
+        monkeypatch.setattr(logging.root, 'level', logging.root.level)
+        return importlib.reload(homework_module)
+
+    yield reload_with_log_level
+    monkeypatch.undo()
+    importlib.reload(homework_module)
+
+
+@pytest.mark.parametrize('log_level, expected_level', [
+    ('verbose', logging.INFO),
+    ('10', logging.DEBUG),
+    ('warning', logging.WARNING),
+])
+def test_log_level_from_env(reload_homework, log_level, expected_level):
+    module = reload_homework(log_level)
+    assert module.LOG_LEVEL_VALUE == expected_level
+    assert logging.root.level == expected_level
+
+
+def test_main_reports_error_again_after_recovery(monkeypatch, homework_module):
+    unavailable = (HTTPStatus.SERVICE_UNAVAILABLE, {})
+    ok = (HTTPStatus.OK, {'homeworks': [], 'current_date': 1000198000})
+    sent, _, _ = run_main(
+        monkeypatch, homework_module,
+        [unavailable, unavailable, ok, unavailable]
+    )
+    error_message = (
+        'Сбой в работе программы: '
+        f'Эндпоинт {homework_module.ENDPOINT} недоступен.\n'
+        f'Код ответа: {HTTPStatus.SERVICE_UNAVAILABLE}'
+    )
+    assert sent == [error_message, error_message]